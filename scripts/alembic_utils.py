@@ -13,6 +13,29 @@ drop_table_lines = """def upgrade() -> None:
 ## Get latest alembic version:
 
 
+def _scan_matching_files(directory, pattern, file_ext: str = ".py"):
+    """
+    Recursively yield directory entries for files that match a given pattern
+    in their filename. Entries come from os.scandir, so their type and stat
+    results are cached instead of re-queried per check.
+    """
+    # fspath rejects None, which os.scandir would take as the current directory
+    directory = os.fspath(directory)
+    if not os.path.isdir(directory):
+        return
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_matching_files(entry.path, pattern, file_ext)
+            # Cheap name checks first, the type check only for candidates
+            elif (
+                pattern in entry.name
+                and entry.name.endswith(file_ext)
+                and entry.is_file(follow_symlinks=False)
+            ):
+                yield entry
+
+
 def find_matching_files(directory, pattern, file_ext: str = ".py"):
     """
     Find all files in a directory that match a given pattern in their filename.
@@ -24,14 +47,9 @@ def find_matching_files(directory, pattern, file_ext: str = ".py"):
     Returns:
         list: List of Path objects for matching files
     """
-    directory_path = Path(directory)
-    matching_files = []
-
-    for file_path in directory_path.glob(f"**/*{file_ext}"):
-        if file_path.is_file() and pattern in file_path.name:
-            matching_files.append(file_path)
-
-    return matching_files
+    return [
+        Path(entry.path) for entry in _scan_matching_files(directory, pattern, file_ext)
+    ]
 
 
 def filter_by_creation_time(file_paths, start_time, end_time):
@@ -40,7 +58,7 @@ def filter_by_creation_time(file_paths, start_time, end_time):
     Sort the results so the most recently created file is first.
 
     Args:
-        file_paths (list): List of Path objects to filter
+        file_paths (iterable): Path or os.DirEntry objects to filter
         start_time (float): Start time in seconds since epoch
         end_time (float): End time in seconds since epoch
 
@@ -48,13 +66,12 @@ def filter_by_creation_time(file_paths, start_time, end_time):
         list: List of Path objects for files created within the time window,
               sorted by creation time (newest first)
     """
-    filtered_files = []
-
-    # Store files with their creation times for sorting
+    # Store files with their creation times for sorting. DirEntry.stat()
+    # reuses the result cached during the directory scan.
     files_with_times = []
 
     for file_path in file_paths:
-        creation_time = os.path.getctime(file_path)
+        creation_time = file_path.stat().st_ctime
         if start_time <= creation_time <= end_time:
             files_with_times.append((file_path, creation_time))
 
@@ -62,7 +79,7 @@ def filter_by_creation_time(file_paths, start_time, end_time):
     files_with_times.sort(key=lambda x: x[1], reverse=True)
 
     # Extract just the file paths in sorted order
-    filtered_files = [file_path for file_path, _ in files_with_times]
+    filtered_files = [Path(file_path) for file_path, _ in files_with_times]
 
     return filtered_files
 
@@ -75,44 +92,22 @@ def replace_lines(file: Path, replaced_text: str, replacing_text: str):
     with open(file, "r") as f:
         lines = f.readlines()
 
-    # Flag to check if replacement was made
-    replacement_made = False
-
-    # Process each line
-    for i in range(len(lines)):
-        if replaced_text in lines[i]:
-            print(f"    Found text on line {i}: {lines[i]}")
-            lines[i] = replacing_text + "\n"
-            print(f"            Replaced Text: {lines[i]}")
-            replacement_made = True
+    # Swap the first matching line for the replacement lines in one pass
+    for i, line in enumerate(lines):
+        if replaced_text in line:
+            print(f"    Found text on line {i}: {line}")
+            new_lines = [new_line + "\n" for new_line in replacing_text.split("\n")]
+            print(f"            Replaced Text: {''.join(new_lines)}")
+            lines[i : i + 1] = new_lines
             break
 
-    # If replacing_text contains multiple lines, split and insert them
-    if "\n" in replacing_text and replacement_made:
-        # Get the index where replacement was made
-        replacement_index = next(
-            i for i, line in enumerate(lines) if replacing_text in line
-        )
-
-        # Remove the single line that was replaced
-        lines.pop(replacement_index)
-
-        # Split the replacing text into multiple lines
-        new_lines = replacing_text.split("\n")
-
-        # Insert each new line at the appropriate position
-        for j, new_line in enumerate(new_lines):
-            # if new_line:  # Skip empty lines
-            lines.insert(replacement_index + j, new_line + "\n")
-
     # Write the modified lines back to the file
-    with open(file, "w") as f:
-        f.writelines(lines)
+    Path(file).write_text("".join(lines))
 
 
 def get_version():
     match_str = "reset"
-    alembic_resets = find_matching_files(alembic_version_dir, match_str)
+    alembic_resets = _scan_matching_files(alembic_version_dir, match_str)
     now = time.time()
     past_minute = now - 600
     recent_versions = filter_by_creation_time(alembic_resets, past_minute, now)
@@ -1,6 +1,7 @@
 import os
+import sys
+import types
 import logging
-import inspect
 from logging.handlers import RotatingFileHandler
 
 # Import logdir:
@@ -9,36 +10,51 @@ from ..config import LOGDIR
 logdir = LOGDIR
 
 
+# Centered "module | function" prefix per call site, keyed by code object and
+# the class of `self` (an inherited method is logged under each subclass).
+# Only the line number changes between calls from the same site.
+_caller_prefixes: dict[tuple[types.CodeType, type | None], str] = {}
+
+
+def _caller_class(frame):
+    # Try to get class name if this is a method call
+    try:
+        self_arg = frame.f_locals.get("self")
+        if self_arg is not None:
+            return self_arg.__class__
+    except Exception:
+        pass  # Just use function name if we can't get class
+    return None
+
+
+def _caller_prefix(code, cls):
+    # Read the code attributes directly; inspect.getframeinfo pulls
+    # source context through linecache, which we never use
+    module = code.co_filename.rpartition("/")[2].rpartition("\\")[2].removesuffix(".py")
+    function = code.co_name
+    if cls is not None:
+        function = f"{cls.__name__}.{function}"
+    return f"{module:^15}| {function:^35}"
+
+
 class CustomAdapter(logging.LoggerAdapter):
     def process(self, msg, kwargs):
-        # Get the stack frame 2 levels up (caller of the logging method)
-        frame = inspect.currentframe()
-        # Go up several frames to get past the adapter and logger internals
+        # Jump straight to the caller of the logging method, skipping
+        # process(), LoggerAdapter.log() and the info()/debug()/... wrapper
         try:
-            # Move up to the actual calling frame (may need adjustment based on your call stack)
-            for _ in range(3):  # Skip our adapter frames
-                if frame.f_back:
-                    frame = frame.f_back
-
-            # Get info about the frame
-            frameinfo = inspect.getframeinfo(frame)
-            module = (
-                frameinfo.filename.split("/")[-1].split("\\")[-1].replace(".py", "")
-            )
-            line = frameinfo.lineno
-            function = frameinfo.function
-
-            # Try to get class name if this is a method call
-            try:
-                if "self" in frame.f_locals:
-                    class_name = frame.f_locals["self"].__class__.__name__
-                    function = f"{class_name}.{function}"
-            except Exception:
-                pass  # Just use function name if we can't get class
-            module_info = f"{module:^15}"
+            frame = sys._getframe(3)
+        except ValueError:
+            # Shallower stack than expected, fall back to the outermost frame
+            frame = sys._getframe()
+            while frame.f_back:
+                frame = frame.f_back
+        try:
+            key = (frame.f_code, _caller_class(frame))
+            prefix = _caller_prefixes.get(key)
+            if prefix is None:
+                prefix = _caller_prefixes[key] = _caller_prefix(*key)
             # Format the log message with caller info
-            extra_info = f"{module_info}| {function:^35} | {line:3}"
-            return f"{extra_info} | {msg}", kwargs
+            return f"{prefix} | {frame.f_lineno:3} | {msg}", kwargs
         finally:
             # Clean up to avoid reference cycles
             del frame
@@ -73,6 +89,7 @@ def get_logger(name, stream=False):
     # formatter = logging.Formatter(
     #    "%(asctime)s - %(name)s - %(levelname)s - [%(module)s.%(funcName)s:%(lineno)d] - %(message)s"
     # )
+    file_handler.setFormatter(formatter)
 
     # Create console handler
     if stream:
@@ -81,67 +98,24 @@ def get_logger(name, stream=False):
         console_handler.setFormatter(formatter)
         logger.addHandler(console_handler)
 
-    file_handler.setFormatter(formatter)
-
     # Add the handlers to the logger
     logger.addHandler(file_handler)
 
     # Wrap with our adapter
     adapted_logger = CustomAdapter(logger, {})
 
-    for i in range(2):
-        adapted_logger.info("")
-    adapted_logger.info(
-        f"\n\n\n\n\n**************** {name} Logger initialized ****************\n\n\n\n"
+    # The banner carries no useful caller context, so log it on the raw
+    # logger (skipping the adapter's frame lookup) as a single record
+    banner = "\n".join(
+        [
+            "",
+            "",
+            f"\n\n\n\n\n**************** {name} Logger initialized ****************\n\n\n\n",
+            "",
+        ]
     )
-    adapted_logger.info("")
-    return adapted_logger  # LoggerWithContext(logger)
-
-
-class LoggerWithContext:
-    """Wrapper around logger to add context information about caller"""
-
-    def __init__(self, logger):
-        self.logger = logger
-
-    def _get_caller_info(self):
-        """Get the class and function name of the caller"""
-        # Go back 2 frames to get the caller of the log method
-        frame = inspect.currentframe()  # .f_back.f_back.f_back
-        info = inspect.getframeinfo(frame)
-
-        # Try to get the class name if called from a class method
-        try:
-            self_arg = frame.f_locals.get("self")
-            if self_arg:
-                class_name = self_arg.__class__.__name__
-                return f"{class_name}.{info.function}"
-            else:
-                return info.function
-        except Exception:
-            # Fallback to just the function name if we can't get class info
-            return info.function
-        finally:
-            # Clean up the frame reference to avoid reference cycles
-            del frame
-
-    def debug(self, msg, *args, **kwargs):
-        self.logger.debug(msg, *args, **kwargs)
-
-    def info(self, msg, *args, **kwargs):
-        self.logger.info(msg, *args, **kwargs)
-
-    def warning(self, msg, *args, **kwargs):
-        self.logger.warning(msg, *args, **kwargs)
-
-    def error(self, msg, *args, **kwargs):
-        self.logger.error(msg, *args, **kwargs)
-
-    def critical(self, msg, *args, **kwargs):
-        self.logger.critical(msg, *args, **kwargs)
-
-    def exception(self, msg, *args, exc_info=True, **kwargs):
-        self.logger.exception(msg, *args, exc_info=exc_info, **kwargs)
+    logger.info(banner)
+    return adapted_logger
 
 
 logger = get_logger("templateer2_Main")
@@ -4,30 +4,150 @@ Parsing the template file and extracting Pydantic classes.
 
 from __future__ import annotations
 import argparse
-import importlib.util
+import ast
+import datetime
+import functools
+import hashlib
 import inspect
 import json
+import logging
 import re
 import sys
-import tempfile
+import threading
 import traceback
+import types
+import typing
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Any, ClassVar, Type
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, ClassVar, Type
 
-import jinja2
-from pydantic import BaseModel, Field, ConfigDict
+import pydantic
 from templateer2._internal.logger import logger
 
+# jinja2 is only needed once something renders, see TemplateRenderer
+if TYPE_CHECKING:
+    import jinja2
 
-class TemplateConfig(BaseModel):
+# Section markers in a template file
+_UV_SCRIPT_RE = re.compile(r"#\s*///\s*script\s*\n(.*?)#\s*///", re.DOTALL)
+_TEMPLATE_RE = re.compile(r"#\s*///\s*template\s*\n(.*?)#\s*///", re.DOTALL)
+
+# `key = value` lines inside the template section, comment markers optional.
+# Keys are anything up to the first `=`, as with the old line splitter
+_CFG_LINE_RE = re.compile(
+    r"^[ \t]*#*[ \t]*([^=\s#][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t#]*$", re.MULTILINE
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a regex pattern used by the `regex_replace` filter."""
+    return re.compile(pattern)
+
+
+def _regex_replace(value, pattern, replacement):
+    """regex_replace filter, reusing compiled patterns across renders."""
+    return _compile_pattern(pattern).sub(replacement, value)
+
+
+def _make_replacer(pattern: str):
+    """make_replacer global: a pattern's bound `sub`, to hoist out of loops."""
+    return _compile_pattern(pattern).sub
+
+
+def _map_replace(value, replacer, replacement):
+    """map_replace filter applying a replacer from `make_replacer`."""
+    return replacer(replacement, value)
+
+
+@functools.lru_cache(maxsize=128)
+def _schema_json(model: Type[pydantic.BaseModel]) -> str:
+    """Dump a model's JSON schema, cached since a class's schema is fixed."""
+    return json.dumps(model.model_json_schema(), indent=2)
+
+
+def _schema_json_filter(model):
+    """schema_json filter: a model's JSON schema, indented."""
+    if hasattr(model, "model_json_schema"):
+        return _schema_json(model)
+    return "Schema not available"
+
+
+# Sources waiting to be compiled, keyed by their sha256. Entries only live
+# for the duration of a _load_template call; the environment's template and
+# bytecode caches keep the result
+_TEMPLATE_SOURCES: Dict[str, str] = {}
+_TEMPLATE_SOURCES_LOCK = threading.Lock()
+
+
+def _load_template_source(name: str):
+    """FunctionLoader callback for environments compiling via _load_template."""
+    source = _TEMPLATE_SOURCES.get(name)
+    if source is None:
+        return None
+    # A sha256 name always stands for the same source, so never reload
+    return source, None, lambda: True
+
+
+def _load_template(env: jinja2.Environment, source: str) -> jinja2.Template:
+    """Load `source` through `env`'s loader under its content hash.
+
+    Naming templates by hash lets a FileSystemBytecodeCache reuse their
+    bytecode across runs.
+    """
+    name = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    with _TEMPLATE_SOURCES_LOCK:
+        _TEMPLATE_SOURCES[name] = source
+        try:
+            return env.get_template(name)
+        finally:
+            del _TEMPLATE_SOURCES[name]
+
+
+# Modules exposed to every template context
+_STD_CONTEXT = {
+    "datetime": datetime,
+    "typing": typing,
+    "pydantic": pydantic,
+    "json": json,
+}
+
+
+def _coerce_value(value: str) -> Any:
+    """Strip quotes from a raw config value and decode list literals."""
+    # Remove quotes if present
+    if len(value) > 1 and value[0] == value[-1] and value[0] in "\"'":
+        value = value[1:-1]
+
+    # Handle list values (e.g., imports = ["file1.py", "file2.py"])
+    if value.startswith("[") and value.endswith("]"):
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            pass
+        try:
+            # Python literals cover single-quoted and mixed-quote lists
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            # Fallback: simple string splitting for unquoted items
+            items = value[1:-1].split(",")
+            return [item.strip().strip("\"'") for item in items if item.strip()]
+
+    return value
+
+
+@dataclass(slots=True)
+class TemplateConfig:
     """Configuration extracted from the template header section."""
 
     output_file: Optional[str] = None
-    imports: List[str] = Field(default_factory=list)
+    imports: List[str] = field(default_factory=list)
     reference_file: Optional[Path] = None
-    extra_params: Dict[str, Any] = Field(default_factory=dict)
+    extra_params: Dict[str, Any] = field(default_factory=dict)
 
-    model_config = ConfigDict(extra="allow")
+    def __post_init__(self) -> None:
+        if self.reference_file is not None:
+            self.reference_file = Path(self.reference_file)
 
     @classmethod
     def from_raw_config(cls, config_dict: Dict[str, Any]) -> TemplateConfig:
@@ -51,24 +171,24 @@ class TemplateConfig(BaseModel):
         )
 
 
-class PydanticClassInfo(BaseModel):
+@dataclass(slots=True, frozen=True)
+class PydanticClassInfo:
     """Information about a Pydantic class."""
 
     cls: Any
     doc: str = ""
-    fields: Dict[str, Any] = Field(default_factory=dict)
+    fields: Dict[str, Any] = field(default_factory=dict)
     # TODO: Investigate pydantic merge_field_infos() for field info
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
 
-
-class PydanticModuleInfo(BaseModel):
+# Compared and hashed by identity so renderers can cache per-module state
+# in a WeakKeyDictionary
+@dataclass(slots=True, frozen=True, eq=False, weakref_slot=True)
+class PydanticModuleInfo:
     """Information about a Python module with Pydantic classes."""
 
     module: Any
-    classes: Dict[str, PydanticClassInfo] = Field(default_factory=dict)
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    classes: Dict[str, PydanticClassInfo] = field(default_factory=dict)
 
     def has_classes(self) -> bool:
         """Check if any Pydantic classes were found."""
@@ -79,15 +199,17 @@ class PydanticModuleInfo(BaseModel):
         return list(self.classes.keys())
 
 
-class TemplateFile(BaseModel):
+@dataclass(slots=True)
+class TemplateFile:
     """Represents a parsed template file."""
 
     path: Path
     python_code: str = ""
     template_content: str = ""
-    config: TemplateConfig = Field(default_factory=TemplateConfig)
+    config: TemplateConfig = field(default_factory=TemplateConfig)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    def __post_init__(self) -> None:
+        self.path = Path(self.path)
 
     @classmethod
     def from_file(cls, file_path: Path) -> TemplateFile:
@@ -97,16 +219,16 @@ class TemplateFile(BaseModel):
 
         content = file_path.read_text()
 
-        # Extract UV script section (skip it for processing)
-        uv_script_pattern = r"#\s*///\s*script\s*\n(.*?)#\s*///"
-        uv_match = re.search(uv_script_pattern, content, re.DOTALL)
-        if uv_match:
-            # Remove the uv script section for further processing
-            content = content.replace(uv_match.group(0), "").strip()
-
-        # Look for template section marker
-        template_pattern = r"#\s*///\s*template\s*\n(.*?)#\s*///"
-        template_match = re.search(template_pattern, content, re.DOTALL)
+        # Locate the UV script section (skipped for processing); the template
+        # section usually comes after it, so resume the search from its end
+        uv_match = _UV_SCRIPT_RE.search(content)
+        template_match = _TEMPLATE_RE.search(content, uv_match.end() if uv_match else 0)
+        if uv_match and not template_match:
+            # Template section placed before the script block, drop the block
+            # so neither the template body nor the Python code includes it
+            content = content[: uv_match.start()] + content[uv_match.end() :]
+            uv_match = None
+            template_match = _TEMPLATE_RE.search(content)
 
         if not template_match:
             raise ValueError(
@@ -118,11 +240,25 @@ class TemplateFile(BaseModel):
         config_dict = cls._parse_template_config(template_config_raw)
         config = TemplateConfig.from_raw_config(config_dict)
 
-        # Everything before the template section is Python code
-        python_code = content[: template_match.start()].strip()
-
-        # Everything after the template section close marker is the Jinja template
-        template_content = content[template_match.end() :].strip().strip('"""').strip()
+        # Everything before the template section, minus the UV script
+        # section, is Python code
+        if uv_match:
+            python_code = (
+                content[: uv_match.start()]
+                + content[uv_match.end() : template_match.start()]
+            ).strip()
+        else:
+            python_code = content[: template_match.start()].strip()
+
+        # Everything after the template section close marker is the Jinja
+        # template, optionally wrapped in a triple-quoted string
+        template_content = (
+            content[template_match.end() :]
+            .strip()
+            .removeprefix('"""')
+            .removesuffix('"""')
+            .strip()
+        )
 
         return cls(
             path=file_path,
@@ -134,45 +270,14 @@ class TemplateFile(BaseModel):
     @staticmethod
     def _parse_template_config(config_text: str) -> Dict[str, Any]:
         """Parse the template configuration section."""
-        config = {}
-        logger.info(f"Parsing template config:")
-        # Process line by line
-        for line in config_text.split("\n"):
-            line = line.strip().strip("#").strip()
-            logger.info(f"    Line: {line}")
-            if not line:  # or line.startswith("#"):
-                logger.info(f"        No config val, skipping")
-                continue
-
-            # Check for key-value pairs
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-                # logger.info(f"        Config key: {key:>20} => {value}")
-
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-
-                # Handle list values (e.g., imports = ["file1.py", "file2.py"])
-                if value.startswith("[") and value.endswith("]"):
-                    try:
-                        # Try to parse as JSON array
-                        list_value = json.loads(value)
-                        config[key] = list_value
-                    except json.JSONDecodeError:
-                        # Fallback: simple string splitting
-                        items = value[1:-1].split(",")
-                        config[key] = [
-                            item.strip().strip("\"'") for item in items if item.strip()
-                        ]
-                else:
-                    config[key] = value
-                logger.info(f"        Config key: {key:>20} => {value}")
-
+        config = {
+            match.group(1): _coerce_value(match.group(2))
+            for match in _CFG_LINE_RE.finditer(config_text)
+        }
+        # Skip formatting the dict (and the adapter's caller lookup) when
+        # INFO records are filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Parsed template config: %s", config)
         return config
 
 
@@ -181,7 +286,19 @@ class PydanticModuleLoader:
 
     @staticmethod
     def load(python_code: str) -> PydanticModuleInfo:
-        """Load Python code as a module and extract Pydantic classes."""
+        """Load Python code as a module and extract Pydantic classes.
+
+        The module is executed once per distinct source and the same
+        PydanticModuleInfo is returned on later calls. Module globals and
+        class attributes changed while rendering one template are therefore
+        still changed for the next render of the same source.
+        """
+        return PydanticModuleLoader._load_cached(python_code)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _load_cached(python_code: str) -> PydanticModuleInfo:
+        """Load and introspect a module once per distinct source."""
         module = PydanticModuleLoader._load_as_module(python_code)
         classes = PydanticModuleLoader._extract_pydantic_classes(module)
 
@@ -190,27 +307,25 @@ class PydanticModuleLoader:
     @staticmethod
     def _load_as_module(python_code: str) -> Any:
         """Load Python code string as a module."""
-        # Generate a unique module name
-        module_name = f"pydantic_module_{id(python_code)}"
-
-        # Create a temporary file
-        temp_file = Path(tempfile.gettempdir()) / f"{module_name}.py"
+        # Named by content, so a source evicted from the cache and loaded
+        # again replaces its own entry rather than leaving a stale one
+        digest = hashlib.blake2b(python_code.encode(), digest_size=16).hexdigest()
+        module_name = f"pydantic_module_{digest}"
+
+        # Execute straight into a fresh module, no temporary file needed
+        module = types.ModuleType(module_name)
+        module.__file__ = f"<{module_name}>"
+        code = compile(python_code, module.__file__, "exec")
+
+        # Forward references are looked up in sys.modules, both while the
+        # models are built and whenever type hints are resolved afterwards
+        sys.modules[module_name] = module
         try:
-            temp_file.write_text(python_code)
-
-            # Import the module
-            spec = importlib.util.spec_from_file_location(module_name, temp_file)
-            if spec is None or spec.loader is None:
-                raise ImportError(f"Could not create module spec for {temp_file}")
-
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-            return module
-        finally:
-            # Clean up
-            if temp_file.exists():
-                temp_file.unlink()
+            exec(code, module.__dict__)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        return module
 
     @staticmethod
     def _extract_pydantic_classes(module: Any) -> Dict[str, PydanticClassInfo]:
@@ -219,14 +334,16 @@ class PydanticModuleLoader:
 
         classes = {}
 
-        for name, obj in inspect.getmembers(module):
+        # Walk the namespace directly, getmembers() sorts and getattr()s every name
+        for name, obj in vars(module).items():
             if (
-                inspect.isclass(obj)
+                isinstance(obj, type)
                 and issubclass(obj, PydanticBase)
-                and obj != PydanticBase
+                and obj is not PydanticBase
             ):
-                # Get docstring
-                doc = inspect.getdoc(obj) or ""
+                # Only the class's own docstring: inspect.getdoc() walks the
+                # MRO and gives undocumented models BaseModel's docstring
+                doc = inspect.cleandoc(obj.__doc__) if obj.__doc__ else ""
 
                 # Get fields based on Pydantic version
                 if hasattr(obj, "model_fields"):
@@ -244,32 +361,32 @@ class TemplateRenderer:
 
     def __init__(self):
         """Initialize the template renderer."""
-        self.env = jinja2.Environment()
+        import jinja2
+
+        # Output is Python/Markdown source, not HTML, so no autoescaping
+        self.env = jinja2.Environment(
+            autoescape=False,
+            auto_reload=False,
+            optimized=True,
+            enable_async=False,
+        )
         self._register_filters()
+        self._schema_json = self.env.filters["schema_json"]
+        # Compiled templates keyed by their source text
+        self._templates: Dict[str, jinja2.Template] = {}
 
     def _register_filters(self):
         """Register custom filters for the Jinja environment."""
-
-        # Schema JSON filter
-        def schema_json_filter(model):
-            if hasattr(model, "model_json_schema"):
-                schema = model.model_json_schema()
-                return json.dumps(schema, indent=2)
-            return "Schema not available"
-
-        # New regex_replace filter using Python's re.sub
-        def regex_replace(value, pattern, replacement):
-            return re.sub(pattern, replacement, value)
-
-        # Register filters
-        self.env.filters["schema_json"] = schema_json_filter
-        self.env.filters["regex_replace"] = regex_replace
+        self.env.filters["schema_json"] = _schema_json_filter
+        self.env.filters["regex_replace"] = _regex_replace
+        self.env.filters["map_replace"] = _map_replace
+        self.env.globals["make_replacer"] = _make_replacer
 
     def render(
         self, template_file: TemplateFile, module_info: PydanticModuleInfo
     ) -> str:
         """Render a template with Pydantic classes."""
-        template = self.env.from_string(template_file.template_content)
+        template = self._get_template(template_file.template_content)
 
         # Build context
         context = self._build_context(template_file, module_info)
@@ -277,31 +394,36 @@ class TemplateRenderer:
         # Render template
         return template.render(**context)
 
+    def _get_template(self, source: str) -> jinja2.Template:
+        """Compile a template source once and reuse it on later renders."""
+        template = self._templates.get(source)
+        if template is None:
+            template = self._templates[source] = self.env.from_string(source)
+        return template
+
     def _build_context(
         self, template_file: TemplateFile, module_info: PydanticModuleInfo
     ) -> Dict[str, Any]:
         """Build the context dictionary for template rendering."""
+        pydantic_docs: Dict[str, str] = {}
+        pydantic_fields: Dict[str, Dict[str, Any]] = {}
+
         # Basic context with module info
         context = {
             "module": module_info.module,
             "config": template_file.config,
-            "pydantic_docs": {
-                name: info.doc for name, info in module_info.classes.items()
-            },
-            "pydantic_fields": {
-                name: info.fields for name, info in module_info.classes.items()
-            },
-            "get_schema_json": self.env.filters["schema_json"],
+            "pydantic_docs": pydantic_docs,
+            "pydantic_fields": pydantic_fields,
+            "get_schema_json": self._schema_json,
         }
 
-        # Add each Pydantic class to the context
+        # Add each Pydantic class, its docs and its fields in a single pass
         for name, info in module_info.classes.items():
+            pydantic_docs[name] = info.doc
+            pydantic_fields[name] = info.fields
             context[name] = info.cls
 
         # Add standard library modules
-        context["datetime"] = __import__("datetime")
-        context["typing"] = __import__("typing")
-        context["pydantic"] = __import__("pydantic")
-        context["json"] = __import__("json")
+        context.update(_STD_CONTEXT)
 
         return context
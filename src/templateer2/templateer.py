@@ -17,23 +17,70 @@ This script loads a template file containing:
 It renders the template using the Pydantic models and writes the output to a file.
 
 Usage:
-    uv run simplified_templateer.py --template=<template_file.mcpt> --output=<output_path>
+    uv run templateer.py --template=<template_file.mcpt> --output=<output_path>
+    uv run templateer.py --template <a.mcpt> <b.mcpt> ... --output=<output_dir>
 """
 
 from __future__ import annotations
 import argparse
-import importlib.util
+import concurrent.futures
+import datetime
+import functools
+import hashlib
 import inspect
 import json
+import os
 import re
 import sys
-import tempfile
+import types
+import typing
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 import jinja2
+import pydantic
 from pydantic import BaseModel, Field
 
+# orjson serializes and parses several times faster when it is installed.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+try:
+    import orjson
+
+    def _loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def _dumps_indented(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+except ImportError:
+
+    def _loads(data: str) -> Any:
+        return json.loads(data)
+
+    def _dumps_indented(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Template section marker: configuration header closed by `# ///`
+_TEMPLATE_SECTION_RE = re.compile(r"#\s*///\s*template\s*\n(.*?)#\s*///", re.DOTALL)
+
+# Modules exposed to every template context
+_STDLIB_CTX = {
+    "datetime": datetime,
+    "typing": typing,
+    "pydantic": pydantic,
+    "json": json,
+}
+
+# Loaded modules keyed by a digest of their source, see PydanticModuleLoader
+_MODULE_CACHE: Dict[bytes, Dict[str, Any]] = {}
+
+# Parsed template files keyed by path, with the (mtime_ns, size) they were read at
+_TEMPLATE_CACHE: Dict[Path, Tuple[int, int, TemplateFile]] = {}
+
+# Output directories already created by process_template in this process
+_dirs_seen: set[Path] = set()
+
 
 class TemplateConfig(BaseModel):
     """Configuration extracted from the template header section."""
@@ -60,9 +107,20 @@ class TemplateFile:
 
     @classmethod
     def from_file(cls, file_path: Path) -> TemplateFile:
-        """Load and parse a template file."""
-        if not file_path.exists():
-            raise FileNotFoundError(f"Template file not found: {file_path}")
+        """Load and parse a template file.
+
+        The parsed result is reused until the file's mtime or size changes.
+        """
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template file not found: {file_path}") from None
+
+        # One entry per file, however the path was spelled
+        key = Path(file_path).resolve()
+        cached = _TEMPLATE_CACHE.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
 
         content = file_path.read_text()
 
@@ -73,8 +131,7 @@ class TemplateFile:
             )
 
         # Look for template section marker
-        template_pattern = r"#\s*///\s*template\s*\n(.*?)#\s*///"
-        template_match = re.search(template_pattern, content, re.DOTALL)
+        template_match = _TEMPLATE_SECTION_RE.search(content)
 
         if not template_match:
             raise ValueError(
@@ -93,48 +150,47 @@ class TemplateFile:
         # Everything before the template section is Python code
         python_code = content[: template_match.start()].strip()
 
-        # Everything after the template section close marker is the Jinja template
-        template_content = content[template_match.end() :].strip().strip('"""').strip()
+        # Everything after the template section close marker is the Jinja template,
+        # optionally wrapped in a triple-quoted string
+        template_content = content[template_match.end() :].strip()
+        if template_content.startswith('"""'):
+            template_content = template_content[3:]
+        if template_content.endswith('"""'):
+            template_content = template_content[:-3]
+        template_content = template_content.strip()
 
-        return cls(file_path, python_code, template_content, config)
+        template_file = cls(file_path, python_code, template_content, config)
+        _TEMPLATE_CACHE[key] = (stat.st_mtime_ns, stat.st_size, template_file)
+        return template_file
 
     @staticmethod
     def _parse_template_config(config_text: str) -> Dict[str, Any]:
         """Parse the template configuration section."""
-        config = {}
+        config: Dict[str, Any] = {}
 
-        # Process line by line
-        for line in config_text.split("\n"):
-            line = line.strip().strip("#").strip()
-            if not line:
+        for raw in config_text.splitlines():
+            line = raw.strip().strip("#").strip()
+            if "=" not in line:
                 continue
-
-            # Check for key-value pairs
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-
-                # Handle list values (e.g., imports = ["file1.py", "file2.py"])
-                if value.startswith("[") and value.endswith("]"):
-                    try:
-                        # Try to parse as JSON array
-                        list_value = json.loads(value)
-                        config[key] = list_value
-                    except json.JSONDecodeError:
-                        # Fallback: simple string splitting
-                        items = value[1:-1].split(",")
-                        config[key] = [
-                            item.strip().strip("\"'") for item in items if item.strip()
-                        ]
-                else:
-                    config[key] = value
+            key, _, value = line.partition("=")
+            key, value = key.strip(), value.strip()
+
+            # Remove matching quotes as-is, backslashes are not escapes
+            if len(value) > 1 and value[0] == value[-1] and value[0] in "\"'":
+                value = value[1:-1]
+
+            # Handle list values (e.g., imports = ["file1.py", "file2.py"])
+            if value.startswith("[") and value.endswith("]"):
+                try:
+                    config[key] = _loads(value)
+                except json.JSONDecodeError:
+                    # Fallback: simple string splitting
+                    items = value[1:-1].split(",")
+                    config[key] = [
+                        item.strip().strip("\"'") for item in items if item.strip()
+                    ]
+            else:
+                config[key] = value
 
         return config
 
@@ -144,36 +200,38 @@ class PydanticModuleLoader:
 
     @staticmethod
     def load(python_code: str) -> Dict[str, Any]:
-        """Load Python code as a module and extract Pydantic classes."""
-        module = PydanticModuleLoader._load_as_module(python_code)
-        classes = PydanticModuleLoader._extract_pydantic_classes(module)
+        """Load Python code as a module and extract Pydantic classes.
+
+        Identical code is only executed once per process.
+        """
+        key = hashlib.blake2b(python_code.encode(), digest_size=16).digest()
+        module_info = _MODULE_CACHE.get(key)
+        if module_info is None:
+            module = PydanticModuleLoader._load_as_module(
+                python_code, f"pydantic_module_{key.hex()}"
+            )
+            classes = PydanticModuleLoader._extract_pydantic_classes(module)
+            module_info = _MODULE_CACHE[key] = {"module": module, "classes": classes}
 
-        return {"module": module, "classes": classes}
+        return module_info
 
     @staticmethod
-    def _load_as_module(python_code: str) -> Any:
-        """Load Python code string as a module."""
-        # Generate a unique module name
-        module_name = f"pydantic_module_{id(python_code)}"
-
-        # Create a temporary file
-        temp_file = Path(tempfile.gettempdir()) / f"{module_name}.py"
+    def _load_as_module(python_code: str, module_name: str) -> Any:
+        """Load Python code string as a module registered under `module_name`."""
+        # Execute the code in a fresh module object, nothing touches disk
+        module = types.ModuleType(module_name)
+        module.__file__ = f"<{module_name}>"
+        code = compile(python_code, module.__file__, "exec")
+
+        # Registered for good: pydantic and typing.get_type_hints resolve
+        # forward references through sys.modules, during exec and later
+        sys.modules[module_name] = module
         try:
-            temp_file.write_text(python_code)
-
-            # Import the module
-            spec = importlib.util.spec_from_file_location(module_name, temp_file)
-            if spec is None or spec.loader is None:
-                raise ImportError(f"Could not create module spec for {temp_file}")
-
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-            return module
-        finally:
-            # Clean up
-            if temp_file.exists():
-                temp_file.unlink()
+            exec(code, module.__dict__)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        return module
 
     @staticmethod
     def _extract_pydantic_classes(module: Any) -> Dict[str, Dict[str, Any]]:
@@ -182,51 +240,191 @@ class PydanticModuleLoader:
 
         classes = {}
 
-        for name, obj in inspect.getmembers(module):
-            if inspect.isclass(obj) and issubclass(obj, BaseModel) and obj != BaseModel:
-                # Get docstring
-                doc = inspect.getdoc(obj) or ""
+        # Walk the namespace directly, getmembers() sorts and getattr()s every name
+        for name, obj in vars(module).items():
+            if name.startswith("_"):
+                continue
+            if (
+                isinstance(obj, type)
+                and issubclass(obj, BaseModel)
+                and obj is not BaseModel
+            ):
+                # Only the class's own docstring: inspect.getdoc() walks the
+                # MRO and gives undocumented models BaseModel's docstring
+                doc = inspect.cleandoc(obj.__doc__) if obj.__doc__ else ""
 
                 # Get fields based on Pydantic version
-                if hasattr(obj, "model_fields"):
-                    fields = obj.model_fields
-                else:
-                    fields = {}
+                fields = getattr(obj, "model_fields", {})
 
                 classes[name] = {"cls": obj, "doc": doc, "fields": fields}
 
         return classes
 
 
-class TemplateRenderer:
-    """Renders Jinja templates with Pydantic models."""
+@functools.lru_cache(maxsize=256)
+def _schema_for(model: type[BaseModel]) -> str:
+    """Render a model's JSON schema once; it never changes for a class."""
+    return _dumps_indented(model.model_json_schema())
+
+
+def _schema_json_filter(model):
+    """Schema JSON filter."""
+    if hasattr(model, "model_json_schema"):
+        return _schema_for(model)
+    return "Schema not available"
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile and keep a pattern for the replace filters."""
+    return re.compile(pattern)
+
+
+def _regex_replace(value, pattern, replacement):
+    """regex_replace filter, `re.sub` with a cached compiled pattern."""
+    return _compile_pattern(pattern).sub(replacement, value)
+
+
+def _make_replacer(pattern: str):
+    """make_replacer global: compiled `sub` for a pattern, set once per template."""
+    return _compile_pattern(pattern).sub
+
+
+def _map_replace(value, replacer, replacement):
+    """map_replace filter: apply a `make_replacer` result to a value."""
+    return replacer(replacement, value)
+
+
+def _unwrap_optional(annotation):
+    """Return the inner annotation of `Optional[X]` / `X | None`, else None."""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union or origin is types.UnionType:
+        args = typing.get_args(annotation)
+        if type(None) in args:
+            inner = [arg for arg in args if arg is not type(None)]
+            return inner[0] if len(inner) == 1 else typing.Union[tuple(inner)]
+    return None
 
-    def __init__(self):
-        """Initialize the template renderer."""
-        self.env = jinja2.Environment()
-        self._register_filters()
 
-    def _register_filters(self):
-        """Register custom filters for the Jinja environment."""
+def _type_name(annotation) -> str:
+    """Readable name for an annotation, keeping any Optional it contains."""
+    inner = _unwrap_optional(annotation)
+    if inner is not None:
+        return f"Optional[{_type_name(inner)}]"
 
-        # Schema JSON filter
-        def schema_json_filter(model):
-            if hasattr(model, "model_json_schema"):
-                schema = model.model_json_schema()
-                return json.dumps(schema, indent=2)
-            return "Schema not available"
+    origin = typing.get_origin(annotation)
+    args = typing.get_args(annotation)
+    if origin is typing.Union or origin is types.UnionType:
+        return " | ".join(_type_name(arg) for arg in args)
+    if origin is list:
+        return f"List[{_type_name(args[0])}]" if args else "List"
+    if isinstance(annotation, type):
+        return annotation.__name__
+    return str(annotation).replace("typing.", "")
 
-        # New regex_replace filter using Python's re.sub
-        def regex_replace(value, pattern, replacement):
-            return re.sub(pattern, replacement, value)
 
-        # Register filters
-        self.env.filters["schema_json"] = schema_json_filter
-        self.env.filters["regex_replace"] = regex_replace
+def _annotation_str(annotation) -> str:
+    """annotation_str filter: readable type name built from the annotation object.
+
+    Only a top-level Optional is unwrapped, the part `is_optional` reports.
+    """
+    inner = _unwrap_optional(annotation)
+    return _type_name(annotation if inner is None else inner)
+
+
+def _is_optional(annotation) -> bool:
+    """is_optional filter: whether the annotation accepts None."""
+    return _unwrap_optional(annotation) is not None
+
+
+def _is_list(annotation) -> bool:
+    """is_list filter: whether the annotation, Optional aside, is a list."""
+    inner = _unwrap_optional(annotation)
+    return typing.get_origin(annotation if inner is None else inner) is list
+
+
+@functools.lru_cache(maxsize=256)
+def _field_summaries(model: type[BaseModel]) -> Dict[str, Dict[str, Any]]:
+    """Flatten a model's fields into plain dicts for templates.
+
+    Type details are resolved here once per class rather than through
+    filters on every render. `field_info` keeps the original FieldInfo.
+    """
+    return {
+        name: {
+            "annotation": field_info.annotation,
+            "type_str": _annotation_str(field_info.annotation),
+            "is_optional": _is_optional(field_info.annotation),
+            "is_list": _is_list(field_info.annotation),
+            "default": field_info.default,
+            "description": field_info.description,
+            "field_info": field_info,
+        }
+        for name, field_info in getattr(model, "model_fields", {}).items()
+    }
+
+
+# Sources under their sha256, held by _get_template only while it compiles
+_TEMPLATE_SOURCES: Dict[str, str] = {}
+
+
+def _load_template_source(name: str):
+    """Loader callback returning the source registered under a hash name."""
+    source = _TEMPLATE_SOURCES.get(name)
+    if source is None:
+        return None
+    # A name always maps to the same source, no reload check needed
+    return source, None, lambda: True
+
+
+# Bytecode goes to Jinja's default cache directory: private to this user
+# and owner checked, unlike a fixed path under /tmp
+try:
+    _BYTECODE_CACHE: Optional[jinja2.BytecodeCache] = jinja2.FileSystemBytecodeCache()
+except (OSError, RuntimeError) as e:
+    print(f"Warning: Jinja bytecode cache disabled: {e}")
+    _BYTECODE_CACHE = None
+
+# Shared Jinja environment, filters are registered once at import. Sources
+# go through a loader so the bytecode cache applies across runs
+_ENV = jinja2.Environment(
+    loader=jinja2.FunctionLoader(_load_template_source),
+    bytecode_cache=_BYTECODE_CACHE,
+    auto_reload=False,
+    cache_size=400,
+    optimized=True,
+)
+_ENV.filters["schema_json"] = _schema_json_filter
+_ENV.filters["regex_replace"] = _regex_replace
+_ENV.filters["map_replace"] = _map_replace
+_ENV.globals["make_replacer"] = _make_replacer
+_ENV.filters["annotation_str"] = _annotation_str
+_ENV.filters["is_optional"] = _is_optional
+_ENV.filters["is_list"] = _is_list
+
+
+@functools.lru_cache(maxsize=128)
+def _get_template(source: str) -> jinja2.Template:
+    """Compile a template source, or fetch it from the Jinja caches, once per source."""
+    name = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    _TEMPLATE_SOURCES[name] = source
+    try:
+        return _ENV.get_template(name)
+    finally:
+        # The compiled template outlives the source, don't keep every one
+        del _TEMPLATE_SOURCES[name]
+
+
+class TemplateRenderer:
+    """Renders Jinja templates with Pydantic models."""
+
+    def __init__(self):
+        """Initialize the template renderer."""
+        self.env = _ENV
 
     def render(self, template_file: TemplateFile, module_info: Dict[str, Any]) -> str:
         """Render a template with Pydantic classes."""
-        template = self.env.from_string(template_file.template_content)
+        template = _get_template(template_file.template_content)
 
         # Build context
         context = self._build_context(template_file, module_info)
@@ -246,7 +444,8 @@ class TemplateRenderer:
                 name: info["doc"] for name, info in module_info["classes"].items()
             },
             "pydantic_fields": {
-                name: info["fields"] for name, info in module_info["classes"].items()
+                name: _field_summaries(info["cls"])
+                for name, info in module_info["classes"].items()
             },
             "get_schema_json": self.env.filters["schema_json"],
         }
@@ -256,14 +455,43 @@ class TemplateRenderer:
             context[name] = info["cls"]
 
         # Add standard library modules
-        context["datetime"] = __import__("datetime")
-        context["typing"] = __import__("typing")
-        context["pydantic"] = __import__("pydantic")
-        context["json"] = __import__("json")
+        context.update(_STDLIB_CTX)
 
         return context
 
 
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write `data` to `path` via a temp file, so readers never see a partial file.
+
+    An existing file keeps its mode, and a symlinked output is written
+    through to the file it points at.
+    """
+    path = Path(os.path.realpath(path))
+    try:
+        mode: Optional[int] = path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+
+    while True:
+        tmp = path.with_name(f".{path.name}.{os.urandom(4).hex()}.tmp")
+        try:
+            # New files get 0666 less the umask, like write_text
+            fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(tmp, mode)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
 def process_template(template_path: Path, output_arg: Optional[Path]) -> Path:
     """Process a template file and generate output.
 
@@ -324,11 +552,20 @@ def process_template(template_path: Path, output_arg: Optional[Path]) -> Path:
             "No output path specified. Use --output argument or 'output' parameter in template."
         )
 
-    # Create parent directory if needed
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Create parent directory if needed, once per directory
+    output_dir = output_path.parent
+    if output_dir not in _dirs_seen:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _dirs_seen.add(output_dir)
 
-    # Write output file
-    output_path.write_text(rendered_content)
+    # Write output file, encoded once and replaced atomically
+    data = rendered_content.encode("utf-8")
+    try:
+        _write_atomic(output_path, data)
+    except FileNotFoundError:
+        # The directory was removed after we first created it
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _write_atomic(output_path, data)
 
     print(f"Template rendered successfully to {output_path}")
     return output_path
@@ -340,7 +577,11 @@ def parse_args():
         description="Render a template using Pydantic models."
     )
     parser.add_argument(
-        "--template", required=True, type=Path, help="Path to the template file"
+        "--template",
+        required=True,
+        type=Path,
+        nargs="+",
+        help="Path to the template file (several may be given)",
     )
     parser.add_argument(
         "--output",
@@ -354,14 +595,38 @@ def parse_args():
 def main():
     """Main function."""
     args = parse_args()
+    templates = args.template
 
-    try:
-        process_template(args.template, args.output)
-        return 0
-    except Exception as e:
-        print(f"Error: {e}")
+    if len(templates) == 1:
+        try:
+            process_template(templates[0], args.output)
+            return 0
+        except Exception as e:
+            print(f"Error: {e}")
+            return 1
+
+    # Every template would be written to the same file
+    if args.output is not None and args.output.suffix:
+        print("Error: --output must be a directory when several templates are given")
         return 1
 
+    # Module exec, compile and render all hold the GIL, so independent
+    # templates are rendered in separate processes
+    failed = 0
+    max_workers = min(len(templates), os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(process_template, template, args.output): template
+            for template in templates
+        }
+        for future in concurrent.futures.as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error: {futures[future]}: {e}")
+                failed += 1
+    return 1 if failed else 0
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -30,24 +30,43 @@ Usage:
 
 from __future__ import annotations
 import argparse
+import atexit
+import concurrent.futures
 import importlib.util
 import inspect
 import json
 import re
 import sys
-import tempfile
+import threading
 import traceback
+import typing
+import weakref
 import asyncio
-from contextlib import AsyncExitStack
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Any, ClassVar, Type, Callable, Awaitable
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Any,
+    ClassVar,
+    Type,
+    Callable,
+    Awaitable,
+    Coroutine,
+    TypeVar,
+)
 
-import jinja2
 from pydantic import BaseModel, Field, ConfigDict
 from templateer2._internal.logger import logger
 
-from mcp import ClientSession, StdioServerParameters, types
-from mcp.client.stdio import stdio_client
+# jinja2 and mcp are imported where they are used, so `--help` and
+# templates without MCP servers don't pay for loading them
+if TYPE_CHECKING:
+    import jinja2
+    from mcp import ClientSession
 
 # TODO: Create standard logger script for these uv scripts. Import, log to subdirectory of the directory the script was called in.
 from templateer2.parsing import (
@@ -57,8 +76,132 @@ from templateer2.parsing import (
     # TemplateFile,
     PydanticModuleLoader,
     # TemplateRenderer,
+    _STD_CONTEXT,
+    _load_template,
+    _load_template_source,
+    _make_replacer,
+    _map_replace,
+    _regex_replace,
+    _schema_json_filter,
 )
 
+_T = TypeVar("_T")
+
+# orjson parses server configs several times faster when it is installed.
+# Its JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+try:
+    import orjson
+
+    def _loads(data: str) -> Any:
+        return orjson.loads(data)
+
+    def _load(f: typing.IO[str]) -> Any:
+        return orjson.loads(f.read())
+
+except ImportError:
+
+    def _loads(data: str) -> Any:
+        return json.loads(data)
+
+    def _load(f: typing.IO[str]) -> Any:
+        return json.load(f)
+
+
+# Section markers in a template file
+_SECTION_RE = re.compile(r"#\s*///\s*(script|template)\s*\n(.*?)#\s*///", re.DOTALL)
+
+# `key = value` lines inside the template section, comment markers optional
+_CFG_LINE_RE = re.compile(
+    r"^[ \t]*#*[ \t]*([^=\s#][^=\r\n]*?)[ \t]*=[ \t]*(.*?)[ \t#\r]*$", re.MULTILINE
+)
+
+
+# Jinja environment shared by every TemplateRenderer, see _get_env()
+_ENV: Optional[jinja2.Environment] = None
+
+
+def _get_env() -> jinja2.Environment:
+    """Return the shared Jinja environment, creating it on first use."""
+    global _ENV
+    if _ENV is None:
+        import jinja2
+
+        # Jinja's default cache directory is private to the current user
+        # (0700, owner checked); a shared path would let other local users
+        # plant bytecode that gets executed here
+        try:
+            bytecode_cache = jinja2.FileSystemBytecodeCache()
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Jinja bytecode cache disabled: {e}")
+            bytecode_cache = None
+        env = jinja2.Environment(
+            loader=jinja2.FunctionLoader(_load_template_source),
+            bytecode_cache=bytecode_cache,
+            auto_reload=False,
+            cache_size=400,
+        )
+
+        # Register filters
+        env.filters["schema_json"] = _schema_json_filter
+        env.filters["regex_replace"] = _regex_replace
+        env.filters["map_replace"] = _map_replace
+        env.globals["make_replacer"] = _make_replacer
+        _ENV = env
+    return _ENV
+
+
+def _mcp():
+    """Import the MCP client machinery on first use.
+
+    Templates without MCP servers never reach this, so they don't pay for
+    importing mcp.
+    """
+    global ClientSession, StdioServerParameters, stdio_client
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+
+    return ClientSession, StdioServerParameters, stdio_client
+
+
+class AsyncLoopThread:
+    """Persistent event loop running in a daemon thread.
+
+    Lets synchronous code, such as functions called from inside a Jinja
+    template, run coroutines without starting a new event loop per call.
+    """
+
+    _instance: ClassVar[Optional[AsyncLoopThread]] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self):
+        """Start the event loop thread."""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, name="templateer2-async-loop", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @classmethod
+    def instance(cls) -> AsyncLoopThread:
+        """Return the shared loop thread, starting it on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def is_current(self) -> bool:
+        """Whether the caller is running on the loop thread."""
+        return threading.get_ident() == self._thread.ident
+
+    def submit(self, coro: Coroutine[Any, Any, _T]) -> concurrent.futures.Future[_T]:
+        """Schedule a coroutine on the loop thread and return its future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
 
 class McpServerConfig(BaseModel):
     """Configuration for an MCP server."""
@@ -84,6 +227,11 @@ class TemplateConfig(BaseModel):
 
     model_config = ConfigDict(extra="allow")
 
+    # Raw config keys that need the MCP parsing below
+    _MCP_KEYS: ClassVar[frozenset] = frozenset(
+        {"mcp-servers", "mcp-tools", "mcp-resources"}
+    )
+
     @classmethod
     def from_raw_config(
         cls, config_dict: Dict[str, Any], base_dir: Optional[Path] = None
@@ -94,6 +242,23 @@ class TemplateConfig(BaseModel):
         imports = config_dict.pop("imports", [])
         reference_file = config_dict.pop("reference-file", None)
 
+        # Convert reference file to Path if specified
+        if reference_file:
+            reference_file = Path(reference_file)
+            # Resolve relative to base directory if provided
+            if base_dir is not None:
+                reference_file = base_dir / reference_file
+            print(f"    Reference file: {reference_file}")
+
+        # Most templates configure no MCP servers, skip that parsing entirely
+        if cls._MCP_KEYS.isdisjoint(config_dict):
+            return cls(
+                output_file=output_file,
+                imports=imports,
+                reference_file=reference_file,
+                extra_params=config_dict,
+            )
+
         # Extract MCP-specific fields
         mcp_servers = {}
 
@@ -119,7 +284,7 @@ class TemplateConfig(BaseModel):
                 try:
                     # Load server config from JSON file
                     with open(file_path, "r") as f:
-                        servers_config = json.load(f)
+                        servers_config = _load(f)
                     print(f"Loaded MCP server config from file: {file_path}")
 
                     for server_name, server_config in servers_config.items():
@@ -129,7 +294,7 @@ class TemplateConfig(BaseModel):
             else:
                 # Parse inline JSON configuration
                 try:
-                    servers_config = json.loads(servers_config_value)
+                    servers_config = _loads(servers_config_value)
                     for server_name, server_config in servers_config.items():
                         mcp_servers[server_name] = McpServerConfig(**server_config)
                 except (json.JSONDecodeError, TypeError) as e:
@@ -138,14 +303,6 @@ class TemplateConfig(BaseModel):
         mcp_tools = config_dict.pop("mcp-tools", [])
         mcp_resources = config_dict.pop("mcp-resources", [])
 
-        # Convert reference file to Path if specified
-        if reference_file:
-            reference_file = Path(reference_file)
-            # Resolve relative to base directory if provided
-            if base_dir is not None:
-                reference_file = base_dir / reference_file
-            print(f"    Reference file: {reference_file}")
-
         # Create the instance with remaining fields as extra_params
         return cls(
             output_file=output_file,
@@ -158,52 +315,193 @@ class TemplateConfig(BaseModel):
         )
 
 
+@dataclass
+class _PooledSession:
+    """A warm MCP session together with its cached listings."""
+
+    session: ClientSession
+    tools: List[Any]
+    resources: List[Any]
+    task: asyncio.Task
+    shutdown: asyncio.Event
+
+
+class MCPSessionPool:
+    """Process-wide pool of warm MCP client sessions.
+
+    Sessions are keyed by the server's command, arguments and environment,
+    so templates using the same server share one stdio process and its
+    tool and resource listings. All coroutines must run on the
+    AsyncLoopThread loop, which owns the session streams.
+    """
+
+    _instance: ClassVar[Optional[MCPSessionPool]] = None
+    _instance_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(self):
+        """Initialize an empty pool."""
+        self._entries: Dict[tuple, _PooledSession] = {}
+        self._connecting: Dict[tuple, asyncio.Task] = {}
+
+    @classmethod
+    def instance(cls) -> MCPSessionPool:
+        """Return the shared pool, creating it and its exit hook on first use."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+                    atexit.register(cls._instance._close_at_exit)
+        return cls._instance
+
+    @staticmethod
+    def _key(server_config: McpServerConfig) -> tuple:
+        env = server_config.env
+        return (
+            server_config.command,
+            tuple(server_config.args),
+            tuple(sorted(env.items())) if env is not None else None,
+        )
+
+    async def acquire(self, server_config: McpServerConfig) -> _PooledSession:
+        """Return a warm session for the server, connecting only on a miss."""
+        key = self._key(server_config)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if not entry.task.done():
+                return entry
+            # The server went away since it was pooled, connect again
+            del self._entries[key]
+
+        # Share one connection attempt between concurrent acquires
+        connecting = self._connecting.get(key)
+        if connecting is None:
+            connecting = asyncio.create_task(self._connect(key, server_config))
+            self._connecting[key] = connecting
+            connecting.add_done_callback(lambda _: self._connecting.pop(key, None))
+        return await asyncio.shield(connecting)
+
+    async def close_all(self):
+        """Shut down every pooled session and wait for them to close."""
+        entries = list(self._entries.values())
+        self._entries.clear()
+        for entry in entries:
+            entry.shutdown.set()
+        await asyncio.gather(*(entry.task for entry in entries), return_exceptions=True)
+
+    def _close_at_exit(self):
+        if not self._entries:
+            return
+        try:
+            AsyncLoopThread.instance().submit(self.close_all()).result(timeout=10)
+        except Exception as e:
+            print(f"Error closing pooled MCP sessions: {e}")
+
+    async def _connect(
+        self, key: tuple, server_config: McpServerConfig
+    ) -> _PooledSession:
+        ready = asyncio.get_running_loop().create_future()
+        shutdown = asyncio.Event()
+        task = asyncio.create_task(
+            self._hold_connection(server_config, ready, shutdown)
+        )
+        session, tools, resources = await ready
+        entry = _PooledSession(session, tools, resources, task, shutdown)
+        self._entries[key] = entry
+        return entry
+
+    async def _hold_connection(
+        self,
+        server_config: McpServerConfig,
+        ready: asyncio.Future,
+        shutdown: asyncio.Event,
+    ):
+        """Own a server's transport and session until the pool shuts it down.
+
+        The stdio transport has to be exited by the same task that entered it,
+        so each connection lives in its own task instead of a shared exit stack.
+        """
+        ClientSession, StdioServerParameters, stdio_client = _mcp()
+
+        try:
+            params = StdioServerParameters(
+                command=server_config.command,
+                args=server_config.args,
+                env=server_config.env,
+            )
+
+            async with stdio_client(params) as (read_stream, write_stream):
+                async with ClientSession(read_stream, write_stream) as session:
+                    await session.initialize()
+
+                    # Fetch tools and resources, they are independent requests
+                    tools_result, resources_result = await asyncio.gather(
+                        session.list_tools(), session.list_resources()
+                    )
+
+                    ready.set_result(
+                        (session, tools_result.tools, resources_result.resources)
+                    )
+                    await shutdown.wait()
+
+        except Exception as e:
+            if ready.done():
+                print(f"MCP server {server_config.command} closed with error: {e}")
+            else:
+                ready.set_exception(e)
+        finally:
+            if not ready.done():
+                ready.cancel()
+
+
 class McpClientManager:
     """Manages MCP client connections for a template."""
 
     def __init__(self, config: TemplateConfig):
         """Initialize the MCP client manager with template config."""
         self.config = config
-        self.exit_stack = AsyncExitStack()
         self.sessions: Dict[str, ClientSession] = {}
         self.server_tools: Dict[str, List[Any]] = {}
         self.server_resources: Dict[str, List[Any]] = {}
+        # Flat lookups so templates can test `(server, name) in mcp_tool_index`
+        self.tool_index: Dict[Tuple[str, str], Any] = {}
+        self.resource_index: Dict[Tuple[str, str], Any] = {}
+        self._pool = MCPSessionPool.instance()
 
     async def initialize(self):
-        """Initialize all configured MCP server connections."""
-        for server_name, server_config in self.config.mcp_servers.items():
-            try:
-                params = StdioServerParameters(
-                    command=server_config.command,
-                    args=server_config.args,
-                    env=server_config.env,
-                )
-
-                stdio_transport = await self.exit_stack.enter_async_context(
-                    stdio_client(params)
-                )
-                session = await self.exit_stack.enter_async_context(
-                    ClientSession(stdio_transport[0], stdio_transport[1])
-                )
+        """Initialize all configured MCP server connections concurrently."""
+        # Surface a missing mcp install once rather than once per server
+        _mcp()
+
+        results = await asyncio.gather(
+            *[
+                self._connect_server(server_name, server_config)
+                for server_name, server_config in self.config.mcp_servers.items()
+            ],
+            return_exceptions=True,
+        )
 
-                await session.initialize()
-                self.sessions[server_name] = session
+        for server_name, result in zip(self.config.mcp_servers, results):
+            if isinstance(result, BaseException):
+                print(f"Error connecting to MCP server {server_name}: {result}")
+                continue
 
-                # Fetch tools and resources
-                tools_result = await session.list_tools()
-                self.server_tools[server_name] = tools_result.tools
+            _, session, tools, resources = result
+            self.sessions[server_name] = session
+            self.server_tools[server_name] = tools
+            self.server_resources[server_name] = resources
+            self.tool_index.update(((server_name, tool.name), tool) for tool in tools)
+            self.resource_index.update(
+                ((server_name, resource.name), resource) for resource in resources
+            )
 
-                resources_result = await session.list_resources()
-                self.server_resources[server_name] = resources_result.resources
+            print(f"Connected to MCP server: {server_name}")
+            print(f"  Available tools: {len(self.server_tools[server_name])}")
+            print(f"  Available resources: {len(self.server_resources[server_name])}")
 
-                print(f"Connected to MCP server: {server_name}")
-                print(f"  Available tools: {len(self.server_tools[server_name])}")
-                print(
-                    f"  Available resources: {len(self.server_resources[server_name])}"
-                )
-
-            except Exception as e:
-                print(f"Error connecting to MCP server {server_name}: {e}")
+    async def _connect_server(self, server_name: str, server_config: McpServerConfig):
+        """Acquire a pooled session for one server."""
+        entry = await self._pool.acquire(server_config)
+        return server_name, entry.session, entry.tools, entry.resources
 
     async def call_tool(
         self, server_name: str, tool_name: str, arguments: Dict[str, Any]
@@ -234,6 +532,19 @@ class McpClientManager:
                 ]
             }
 
+    async def call_tools_batch(self, calls: List[tuple]) -> List[Any]:
+        """Call several tools concurrently.
+
+        `calls` holds `(server_name, tool_name, arguments)` tuples; results
+        come back in the same order.
+        """
+        return await asyncio.gather(
+            *(
+                self.call_tool(server_name, tool_name, arguments)
+                for server_name, tool_name, arguments in calls
+            )
+        )
+
     async def read_resource(self, server_name: str, resource_uri: str) -> Any:
         """Read a resource from an MCP server."""
         if server_name not in self.sessions:
@@ -264,8 +575,12 @@ class McpClientManager:
             }
 
     async def close(self):
-        """Close all MCP client sessions."""
-        await self.exit_stack.aclose()
+        """Drop this template's sessions.
+
+        The sessions belong to the pool, which keeps them open for later
+        templates and shuts them down when the process exits.
+        """
+        self.sessions.clear()
 
 
 class TemplateRenderer:
@@ -273,26 +588,20 @@ class TemplateRenderer:
 
     def __init__(self):
         """Initialize the template renderer."""
-        self.env = jinja2.Environment()
-        self._register_filters()
-
-    def _register_filters(self):
-        """Register custom filters for the Jinja environment."""
-
-        # Schema JSON filter
-        def schema_json_filter(model):
-            if hasattr(model, "model_json_schema"):
-                schema = model.model_json_schema()
-                return json.dumps(schema, indent=2)
-            return "Schema not available"
-
-        # New regex_replace filter using Python's re.sub
-        def regex_replace(value, pattern, replacement):
-            return re.sub(pattern, replacement, value)
-
-        # Register filters
-        self.env.filters["schema_json"] = schema_json_filter
-        self.env.filters["regex_replace"] = regex_replace
+        self.env = _get_env()
+        # Compiled templates keyed by their source text
+        self._templates: Dict[str, jinja2.Template] = {}
+        # Context entries derived from each module, built once per module
+        self._module_contexts: weakref.WeakKeyDictionary[
+            PydanticModuleInfo, Dict[str, Any]
+        ] = weakref.WeakKeyDictionary()
+
+    def _compile(self, source: str) -> jinja2.Template:
+        """Return the template for `source`, compiled on this renderer's first use."""
+        template = self._templates.get(source)
+        if template is None:
+            template = self._templates[source] = _load_template(self.env, source)
+        return template
 
     def render(
         self,
@@ -301,7 +610,7 @@ class TemplateRenderer:
         context_extension: Dict[str, Any] = None,
     ) -> str:
         """Render a template with Pydantic classes and optional custom context."""
-        template = self.env.from_string(template_file.template_content)
+        template = self._compile(template_file.template_content)
 
         # Build context
         context = self._build_context(template_file, module_info)
@@ -317,10 +626,19 @@ class TemplateRenderer:
         self, template_file: TemplateFile, module_info: PydanticModuleInfo
     ) -> Dict[str, Any]:
         """Build the context dictionary for template rendering."""
+        module_context = self._module_contexts.get(module_info)
+        if module_context is None:
+            module_context = self._build_module_context(module_info)
+            self._module_contexts[module_info] = module_context
+
+        # Only the config differs between templates sharing a module
+        return {"config": template_file.config, **module_context}
+
+    def _build_module_context(self, module_info: PydanticModuleInfo) -> Dict[str, Any]:
+        """Build the context entries that depend only on the module."""
         # Basic context with module info
         context = {
             "module": module_info.module,
-            "config": template_file.config,
             "pydantic_docs": {
                 name: info.doc for name, info in module_info.classes.items()
             },
@@ -335,10 +653,7 @@ class TemplateRenderer:
             context[name] = info.cls
 
         # Add standard library modules
-        context["datetime"] = __import__("datetime")
-        context["typing"] = __import__("typing")
-        context["pydantic"] = __import__("pydantic")
-        context["json"] = __import__("json")
+        context.update(_STD_CONTEXT)
 
         return context
 
@@ -359,18 +674,18 @@ class TemplateFile(BaseModel):
         if not file_path.exists():
             raise FileNotFoundError(f"Template file not found: {file_path}")
 
-        content = file_path.read_text()
+        # One explicit UTF-8 decode, no locale codec or newline translation
+        content = file_path.read_bytes().decode("utf-8")
 
-        # Extract UV script section (skip it for processing)
-        uv_script_pattern = r"#\s*///\s*script\s*\n(.*?)#\s*///"
-        uv_match = re.search(uv_script_pattern, content, re.DOTALL)
-        if uv_match:
-            # Remove the uv script section for further processing
-            content = content.replace(uv_match.group(0), "").strip()
-
-        # Look for template section marker
-        template_pattern = r"#\s*///\s*template\s*\n(.*?)#\s*///"
-        template_match = re.search(template_pattern, content, re.DOTALL)
+        # Locate the UV script and template sections in a single scan; only
+        # a script section ahead of the template affects the Python code
+        uv_match = template_match = None
+        for match in _SECTION_RE.finditer(content):
+            if match.group(1) == "template":
+                template_match = match
+                break
+            if uv_match is None:
+                uv_match = match
 
         if not template_match:
             raise ValueError(
@@ -378,15 +693,29 @@ class TemplateFile(BaseModel):
             )
 
         # Extract the template configuration
-        template_config_raw = template_match.group(1).strip()
+        template_config_raw = template_match.group(2).strip()
         config_dict = cls._parse_template_config(template_config_raw, file_path.parent)
         config = TemplateConfig.from_raw_config(config_dict, file_path.parent)
 
-        # Everything before the template section is Python code
-        python_code = content[: template_match.start()].strip()
-
-        # Everything after the template section close marker is the Jinja template
-        template_content = content[template_match.end() :].strip().strip('"""').strip()
+        # Everything before the template section is Python code, minus the
+        # UV script section
+        if uv_match:
+            python_code = (
+                content[: uv_match.start()]
+                + content[uv_match.end() : template_match.start()]
+            ).strip()
+        else:
+            python_code = content[: template_match.start()].strip()
+
+        # Everything after the template section close marker is the Jinja
+        # template, minus a UV script section placed after it
+        body = content[template_match.end() :]
+        if uv_match is None:
+            for match in _SECTION_RE.finditer(body):
+                if match.group(1) == "script":
+                    body = body[: match.start()] + body[match.end() :]
+                    break
+        template_content = body.strip().strip('"""').strip()
 
         return cls(
             path=file_path,
@@ -399,46 +728,60 @@ class TemplateFile(BaseModel):
     def _parse_template_config(config_text: str, base_dir: Path) -> Dict[str, Any]:
         """Parse the template configuration section."""
         config = {}
-        print(f"Parsing template config:")
-        # Process line by line
-        for line in config_text.split("\n"):
-            line = line.strip().strip("#").strip()
-            print(f"    Line: {line}")
-            if not line:  # or line.startswith("#"):
-                print(f"        No config val, skipping")
-                continue
+        logger.debug("Parsing template config")
+        for match in _CFG_LINE_RE.finditer(config_text):
+            key, value = match.groups()
 
-            # Check for key-value pairs
-            if "=" in line:
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
+            # Remove quotes if present
+            if len(value) > 1 and value[0] == value[-1] and value[0] in "\"'":
+                value = value[1:-1]
 
-                # Remove quotes if present
-                if value.startswith('"') and value.endswith('"'):
-                    value = value[1:-1]
-                elif value.startswith("'") and value.endswith("'"):
-                    value = value[1:-1]
-
-                # Handle list values (e.g., imports = ["file1.py", "file2.py"])
-                if value.startswith("[") and value.endswith("]"):
-                    try:
-                        # Try to parse as JSON array
-                        list_value = json.loads(value)
-                        config[key] = list_value
-                    except json.JSONDecodeError:
-                        # Fallback: simple string splitting
-                        items = value[1:-1].split(",")
-                        config[key] = [
-                            item.strip().strip("\"'") for item in items if item.strip()
-                        ]
-                else:
-                    config[key] = value
-                print(f"        Config key: {key:>20} => {value}")
+            # Handle list values (e.g., imports = ["file1.py", "file2.py"])
+            if value[:1] == "[" and value[-1:] == "]":
+                try:
+                    # Try to parse as JSON array
+                    config[key] = json.loads(value)
+                except json.JSONDecodeError:
+                    # Fallback: simple string splitting
+                    items = value[1:-1].split(",")
+                    config[key] = [
+                        item.strip().strip("\"'") for item in items if item.strip()
+                    ]
+            else:
+                config[key] = value
+            logger.debug("    Config key: %20s => %s", key, value)
 
         return config
 
 
+def _not_connected_tool(server, tool, args):
+    return {
+        "content": [{"type": "text", "text": f"MCP server '{server}' not connected"}]
+    }
+
+
+def _not_connected_resource(server, uri):
+    return {
+        "contents": [{"type": "text", "text": f"MCP server '{server}' not connected"}]
+    }
+
+
+def _not_connected_tools_batch(calls):
+    return [_not_connected_tool(server, tool, args) for server, tool, args in calls]
+
+
+# Empty MCP context variables, available to templates rendered without MCP
+_NO_MCP_CONTEXT = {
+    "mcp_tools": {},
+    "mcp_resources": {},
+    "mcp_tool_index": {},
+    "mcp_resource_index": {},
+    "mcp_call_tool": _not_connected_tool,
+    "mcp_call_tools_batch": _not_connected_tools_batch,
+    "mcp_read_resource": _not_connected_resource,
+}
+
+
 class TemplateProcessor:
     """Processes a template file and generates output."""
 
@@ -451,6 +794,12 @@ class TemplateProcessor:
 
     async def async_process(self) -> Path:
         """Process the template asynchronously and return the output file path."""
+        # MCP sessions live on the shared loop thread, so the whole run does
+        # too, whichever loop awaited it
+        loop_thread = AsyncLoopThread.instance()
+        if not loop_thread.is_current():
+            return await asyncio.wrap_future(loop_thread.submit(self.async_process()))
+
         # Parse template file
         template_file = TemplateFile.from_file(self.template_path)
 
@@ -473,30 +822,18 @@ class TemplateProcessor:
 
             print(f"Found Pydantic classes: {', '.join(module_info.get_class_names())}")
 
-            # Initialize empty MCP context variables that will always be available
-            context_extension = {
-                "mcp_tools": {},
-                "mcp_resources": {},
-                "mcp_call_tool": lambda server, tool, args: {
-                    "content": [
-                        {"type": "text", "text": f"MCP server '{server}' not connected"}
-                    ]
-                },
-                "mcp_read_resource": lambda server, uri: {
-                    "contents": [
-                        {"type": "text", "text": f"MCP server '{server}' not connected"}
-                    ]
-                },
-            }
-
-            # Update with actual MCP context if available
-            if self.mcp_manager and hasattr(self.mcp_manager, "sessions"):
+            if self.mcp_manager is None:
+                # Nothing in the template can block on MCP, render in place
+                rendered_content = self.renderer.render(
+                    template_file, module_info, _NO_MCP_CONTEXT
+                )
+            else:
                 # Define safe wrapper functions for error handling
                 def safe_call_tool(server, tool, args):
                     try:
-                        return asyncio.run(
+                        return loop_thread.submit(
                             self.mcp_manager.call_tool(server, tool, args)
-                        )
+                        ).result()
                     except Exception as e:
                         print(f"Error calling tool {tool} on server {server}: {e}")
                         return {
@@ -510,7 +847,9 @@ class TemplateProcessor:
 
                 def safe_read_resource(server, uri):
                     try:
-                        return asyncio.run(self.mcp_manager.read_resource(server, uri))
+                        return loop_thread.submit(
+                            self.mcp_manager.read_resource(server, uri)
+                        ).result()
                     except Exception as e:
                         print(f"Error reading resource {uri} from server {server}: {e}")
                         return {
@@ -522,18 +861,42 @@ class TemplateProcessor:
                             ]
                         }
 
-                context_extension.update(
-                    {
-                        "mcp_tools": self.mcp_manager.server_tools,
-                        "mcp_resources": self.mcp_manager.server_resources,
-                        "mcp_call_tool": safe_call_tool,
-                        "mcp_read_resource": safe_read_resource,
-                    }
-                )
+                # {{ mcp_call_tools_batch([(server, tool, args), ...]) }} runs
+                # the calls concurrently and returns results in call order
+                def safe_call_tools_batch(calls):
+                    try:
+                        return loop_thread.submit(
+                            self.mcp_manager.call_tools_batch(calls)
+                        ).result()
+                    except Exception as e:
+                        print(f"Error calling tool batch: {e}")
+                        return [
+                            {
+                                "content": [
+                                    {
+                                        "type": "text",
+                                        "text": f"[Tool execution error: {str(e)}]",
+                                    }
+                                ]
+                            }
+                            for _ in calls
+                        ]
 
-            rendered_content = self.renderer.render(
-                template_file, module_info, context_extension
-            )
+                context_extension = {
+                    "mcp_tools": self.mcp_manager.server_tools,
+                    "mcp_resources": self.mcp_manager.server_resources,
+                    "mcp_tool_index": self.mcp_manager.tool_index,
+                    "mcp_resource_index": self.mcp_manager.resource_index,
+                    "mcp_call_tool": safe_call_tool,
+                    "mcp_call_tools_batch": safe_call_tools_batch,
+                    "mcp_read_resource": safe_read_resource,
+                }
+
+                # Render off the loop thread; the template's mcp_* calls block
+                # on coroutines that need this loop to keep running
+                rendered_content = await asyncio.to_thread(
+                    self.renderer.render, template_file, module_info, context_extension
+                )
 
             # Determine output filename
             output_filename = (
@@ -545,7 +908,8 @@ class TemplateProcessor:
 
             # Write output file
             output_path = self.output_dir / output_filename
-            output_path.write_text(rendered_content)
+            # Encode once and skip text-mode newline translation
+            output_path.write_bytes(rendered_content.encode("utf-8"))
 
             print(f"Template rendered successfully to {output_path}")
             return output_path
@@ -555,8 +919,17 @@ class TemplateProcessor:
                 await self.mcp_manager.close()
 
     def process(self) -> Path:
-        """Synchronous wrapper for async_process."""
-        return asyncio.run(self.async_process())
+        """Synchronous wrapper for async_process.
+
+        Runs on the shared loop thread, so it also works when the caller
+        already has a running event loop.
+        """
+        loop_thread = AsyncLoopThread.instance()
+        if loop_thread.is_current():
+            raise RuntimeError(
+                "process() would block the loop thread, await async_process() instead"
+            )
+        return loop_thread.submit(self.async_process()).result()
 
 
 def parse_args():
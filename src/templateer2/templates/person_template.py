@@ -25,17 +25,20 @@ class Person(BaseModel):
 {{ pydantic_docs["Person"] }}
 
 ### Fields:
+{%- set strip_class = make_replacer("^<class\\s*'([^']+)'\\s*>$") %}
+{%- set strip_optional = make_replacer("^(?:typing\\.)?Optional\\[(.*)\\]$") %}
+{%- set strip_typing = make_replacer("typing\\.") %}
 {% for field_name, field in pydantic_fields["Person"].items() %}
 
 #### {{ field_name }}
 {%- set type_str = field.annotation|string %}
 {%- if type_str.startswith("<class") %}
-    {%- set type_str = type_str | regex_replace("^<class\\s*'([^']+)'\\s*>$", "\\1") %}
+    {%- set type_str = type_str | map_replace(strip_class, "\\1") %}
 {%- endif %}
 {%- if type_str.startswith("typing.Optional[") or type_str.startswith("Optional[") %}
-    {%- set type_str = type_str | regex_replace("^(?:typing\\.)?Optional\\[(.*)\\]$", "\\1") %}
+    {%- set type_str = type_str | map_replace(strip_optional, "\\1") %}
 {%- endif %}
-{%- set type_str = type_str | regex_replace("typing\\.", "") %}
+{%- set type_str = type_str | map_replace(strip_typing, "") %}
 - **Type:** {{ type_str }}
 {%- if "Optional" in field.annotation|string %}
 - Optional=True
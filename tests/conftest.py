@@ -1 +1,42 @@
 """Configuration for the pytest test suite."""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import os
+import tempfile
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+# The package logger writes under $ROOT/logs, which must be set before import
+os.environ.setdefault("ROOT", tempfile.mkdtemp(prefix="templateer2-tests-"))
+
+
+@pytest.fixture(params=["parsing", "templateer", "templateer_old"])
+def template_module(request: pytest.FixtureRequest) -> types.ModuleType:
+    """Each module that parses template files.
+
+    Parameters:
+        request: Pytest fixture request carrying the module name.
+    """
+    return importlib.import_module(f"templateer2.{request.param}")
+
+
+@pytest.fixture
+def parse_config(
+    template_module: types.ModuleType, tmp_path: Path
+) -> Callable[[str], Dict[str, Any]]:
+    """The module's config section parser, taking the section text.
+
+    Parameters:
+        template_module: The module under test.
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    parse = template_module.TemplateFile._parse_template_config
+    if template_module.__name__ == "templateer2.templateer_old":
+        return functools.partial(parse, base_dir=tmp_path)
+    return parse
@@ -0,0 +1,39 @@
+"""Tests for the alembic version helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from templateer2._internal.user_scripts import alembic_utils
+
+
+def test_find_matching_files(tmp_path: Path) -> None:
+    """Find matching files in nested directories only.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "abc_reset.py").write_text("")
+    (tmp_path / "abc_reset.txt").write_text("")
+    (tmp_path / "other.py").write_text("")
+    (tmp_path / "dir_reset.py").mkdir()
+    found = alembic_utils.find_matching_files(tmp_path, "reset")
+    assert found == [tmp_path / "sub" / "abc_reset.py"]
+
+
+def test_find_matching_files_missing_directory(tmp_path: Path) -> None:
+    """Find nothing in a directory that does not exist.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    assert alembic_utils.find_matching_files(tmp_path / "missing", "reset") == []
+
+
+def test_find_matching_files_without_directory() -> None:
+    """Refuse to scan when no directory is configured."""
+    with pytest.raises(TypeError):
+        alembic_utils.find_matching_files(None, "reset")
@@ -0,0 +1,20 @@
+"""Tests for the template file parser."""
+
+from __future__ import annotations
+
+import jinja2
+
+from templateer2.parsing import (
+    _TEMPLATE_SOURCES,
+    _load_template,
+    _load_template_source,
+)
+
+
+def test_load_template_releases_source() -> None:
+    """Keep a template source only while it is being compiled."""
+    env = jinja2.Environment(loader=jinja2.FunctionLoader(_load_template_source))
+    template = _load_template(env, "{{ x }}!")
+    assert template.render(x=1) == "1!"
+    assert _load_template(env, "{{ x }}!") is template
+    assert not _TEMPLATE_SOURCES
@@ -0,0 +1,97 @@
+"""Tests shared by every template file parser."""
+
+from __future__ import annotations
+
+import types
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ('imports = ["a.py", "b.py"]', ["a.py", "b.py"]),
+        ("imports = ['a.py', 'b.py']", ["a.py", "b.py"]),
+        ("imports = [a.py, b.py]", ["a.py", "b.py"]),
+        ("flags = [true, false, null]", [True, False, None]),
+        ("title = [Draft] My doc", "[Draft] My doc"),
+        ('output-file = "C:\\new\\table.md"', "C:\\new\\table.md"),
+        ('output-file = "C:\\Users\\x.md"', "C:\\Users\\x.md"),
+        ('pattern = "\\d+"', "\\d+"),
+        ("quote = 'It's'", "It's"),
+        ('x = "a" # trailing', '"a" # trailing'),
+    ],
+)
+def test_parse_config_values(
+    line: str, expected: object, parse_config: Callable[[str], Dict[str, Any]]
+) -> None:
+    """Parse config values the way the original line splitter did.
+
+    Parameters:
+        line: A config line from the template section.
+        expected: The parsed value.
+        parse_config: The config section parser under test.
+    """
+    key = line.partition("=")[0].strip()
+    assert parse_config(f"# {line}") == {key: expected}
+
+
+@pytest.mark.parametrize("key", ["weird.key", "my key", "output-file"])
+def test_parse_config_keys(
+    key: str, parse_config: Callable[[str], Dict[str, Any]]
+) -> None:
+    """Keep every key up to the first `=`.
+
+    Parameters:
+        key: A config key.
+        parse_config: The config section parser under test.
+    """
+    assert parse_config(f"# {key} = value ##") == {key: "value"}
+
+
+@pytest.mark.parametrize(
+    "body", ['"""\n{{ 1 }}\n"""', '{{ 1 }}\n"""', '"""\n{{ 1 }}', "{{ 1 }}"]
+)
+def test_template_body_quotes(
+    body: str, template_module: types.ModuleType, tmp_path: Path
+) -> None:
+    """Trim a leading and a trailing triple quote independently.
+
+    Parameters:
+        body: The template body after the template section.
+        template_module: The module under test.
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    template = tmp_path / "t.mcpt"
+    template.write_text(f"# /// template\n# x = 1\n# ///\n{body}\n")
+    parsed = template_module.TemplateFile.from_file(template)
+    assert parsed.template_content == "{{ 1 }}"
+
+
+@pytest.mark.parametrize(
+    "template_module", ["parsing", "templateer_old"], indirect=True
+)
+def test_script_block_after_template_section(
+    template_module: types.ModuleType, tmp_path: Path
+) -> None:
+    """Leave a UV script block after the template section out of the template.
+
+    The standalone templateer script does not read UV script blocks.
+
+    Parameters:
+        template_module: The module under test.
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    template = tmp_path / "t.py"
+    template.write_text(
+        "class A:\n    pass\n\n"
+        '# /// template\n# output-file = "a.md"\n# ///\n'
+        '"""\n{{ 1 }}\n"""\n\n'
+        '# /// script\n# dependencies = ["pydantic"]\n# ///\n'
+    )
+    parsed = template_module.TemplateFile.from_file(template)
+    assert parsed.config.output_file == "a.md"
+    assert parsed.python_code == "class A:\n    pass"
+    assert parsed.template_content == "{{ 1 }}"
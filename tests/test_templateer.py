@@ -0,0 +1,175 @@
+"""Tests for the standalone template renderer script."""
+
+from __future__ import annotations
+
+import typing
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from templateer2 import templateer
+
+
+@pytest.mark.parametrize(
+    ("annotation", "expected", "optional"),
+    [
+        (str, "str", False),
+        (Optional[str], "str", True),
+        (List[str], "List[str]", False),
+        (List[Optional[str]], "List[Optional[str]]", False),
+        (Optional[List[int]], "List[int]", True),
+        (Dict[str, Optional[int]], "Dict[str, Optional[int]]", False),
+    ],
+)
+def test_annotation_str(annotation: object, expected: str, optional: bool) -> None:
+    """Unwrap only the top-level Optional, the one `is_optional` reports.
+
+    Parameters:
+        annotation: A field annotation.
+        expected: The rendered type name.
+        optional: Whether the annotation is optional.
+    """
+    assert templateer._annotation_str(annotation) == expected
+    assert templateer._is_optional(annotation) is optional
+
+
+def test_forward_references_resolve() -> None:
+    """Keep template modules importable so forward references resolve later."""
+    code = (
+        "from __future__ import annotations\n"
+        "import typing\n"
+        "from typing import Optional\n"
+        "from pydantic import BaseModel\n\n"
+        "class Child(BaseModel):\n"
+        "    name: str\n\n"
+        "class Parent(BaseModel):\n"
+        '    child: Optional["Child"] = None\n'
+    )
+    module_info = templateer.PydanticModuleLoader.load(code)
+    parent = module_info["classes"]["Parent"]["cls"]
+    child = module_info["classes"]["Child"]["cls"]
+    assert typing.get_type_hints(parent)["child"] == Optional[child]
+    assert parent.model_validate({"child": {"name": "x"}}).child.name == "x"
+
+
+def test_template_sources_released() -> None:
+    """Drop each template source once it has been compiled."""
+    template = templateer._get_template("{{ x }}?")
+    assert template.render(x=2) == "2?"
+    assert not templateer._TEMPLATE_SOURCES
+
+
+def test_template_file_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reuse a parsed file under any spelling of its path until it changes.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to change the working directory.
+    """
+    monkeypatch.chdir(tmp_path)
+    template = tmp_path / "t.mcpt"
+    template.write_text("# /// template\n# output-file = a.md\n# ///\n{{ 1 }}\n")
+    parsed = templateer.TemplateFile.from_file(template)
+    assert templateer.TemplateFile.from_file(Path("t.mcpt")) is parsed
+    assert templateer.TemplateFile.from_file(Path("./t.mcpt")) is parsed
+
+    template.write_text("# /// template\n# output-file = bb.md\n# ///\n{{ 1 }}\n")
+    reparsed = templateer.TemplateFile.from_file(template)
+    assert reparsed is not parsed
+    assert reparsed.config.output_file == "bb.md"
+
+
+def test_write_atomic_keeps_mode_and_symlinks(tmp_path: Path) -> None:
+    """Replace an existing output's content, not its mode or symlink.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    target = tmp_path / "out.md"
+    target.write_bytes(b"old")
+    target.chmod(0o600)
+    link = tmp_path / "link.md"
+    link.symlink_to(target)
+
+    templateer._write_atomic(link, b"new")
+    assert link.is_symlink()
+    assert target.read_bytes() == b"new"
+    assert target.stat().st_mode & 0o777 == 0o600
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["link.md", "out.md"]
+
+
+def test_write_atomic_cleans_up_on_failure(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Leave the existing output and no temp file behind when the write fails.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to make the replace fail.
+    """
+    target = tmp_path / "out.md"
+    target.write_bytes(b"old")
+
+    def fail(*args: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(templateer.os, "replace", fail)
+    with pytest.raises(OSError, match="disk full"):
+        templateer._write_atomic(target, b"new")
+    assert target.read_bytes() == b"old"
+    assert [path.name for path in tmp_path.iterdir()] == ["out.md"]
+
+
+_MODEL_TEMPLATE = (
+    "from pydantic import BaseModel\n\n"
+    "class A(BaseModel):\n"
+    "    x: int = 1\n\n"
+    "# /// template\n# ///\n"
+    '"""\n{{ A().x }}\n"""\n'
+)
+
+
+def test_main_several_templates(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Render every template and exit with 1 when any of them fails.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to set the command line.
+        capsys: Pytest fixture to capture output.
+    """
+    good = tmp_path / "good.mcpt"
+    good.write_text(_MODEL_TEMPLATE)
+    bad = tmp_path / "bad.mcpt"
+    bad.write_text("no template section\n")
+    out = tmp_path / "out"
+    argv = ["templateer", "--template", str(good), str(bad), "--output", str(out)]
+    monkeypatch.setattr("sys.argv", argv)
+
+    assert templateer.main() == 1
+    assert (out / "good.md").read_text() == "1"
+    assert f"Error: {bad}" in capsys.readouterr().out
+
+
+def test_main_rejects_file_output(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Refuse to render several templates into a single file.
+
+    Parameters:
+        tmp_path: Pytest fixture providing a temporary directory.
+        monkeypatch: Pytest fixture to set the command line.
+    """
+    templates = [tmp_path / "p.mcpt", tmp_path / "q.mcpt"]
+    for template in templates:
+        template.write_text(_MODEL_TEMPLATE)
+    out = tmp_path / "same.md"
+    argv = ["templateer", "--template", *map(str, templates), "--output", str(out)]
+    monkeypatch.setattr("sys.argv", argv)
+
+    assert templateer.main() == 1
+    assert not out.exists()
@@ -0,0 +1,106 @@
+"""Tests for the MCP template processor's file parser."""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from templateer2.templateer_old import McpServerConfig, MCPSessionPool, TemplateFile
+
+
+@pytest.mark.parametrize("key", ["weird.key", "my key", "output-file"])
+def test_parse_config_crlf(key: str, tmp_path: Path) -> None:
+    """Drop the carriage return of CRLF lines, since files are read as bytes.
+
+    Parameters:
+        key: A config key.
+        tmp_path: Pytest fixture providing a temporary directory.
+    """
+    config = TemplateFile._parse_template_config(f"# {key} = value\r\n", tmp_path)
+    assert config == {key: "value"}
+
+
+@pytest.fixture
+def connects(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Replace server connections with stubs and record each one.
+
+    Parameters:
+        monkeypatch: Pytest fixture to stub the connection.
+    """
+    commands: list[str] = []
+
+    async def hold_connection(
+        self: MCPSessionPool,
+        server_config: McpServerConfig,
+        ready: asyncio.Future,
+        shutdown: asyncio.Event,
+    ) -> None:
+        commands.append(server_config.command)
+        ready.set_result((object(), [], []))
+        await shutdown.wait()
+
+    monkeypatch.setattr(MCPSessionPool, "_hold_connection", hold_connection)
+    return commands
+
+
+def test_session_pool_reuses_sessions(connects: list[str]) -> None:
+    """Connect once per server, also for concurrent acquires.
+
+    Parameters:
+        connects: Commands of the stubbed connections made.
+    """
+
+    async def run() -> None:
+        pool = MCPSessionPool()
+        config = McpServerConfig(command="server")
+        first, second = await asyncio.gather(pool.acquire(config), pool.acquire(config))
+        assert first is second
+        assert await pool.acquire(McpServerConfig(command="server")) is first
+        await pool.close_all()
+
+    asyncio.run(run())
+    assert connects == ["server"]
+
+
+def test_session_pool_reconnects(connects: list[str]) -> None:
+    """Connect again once a pooled session's task has finished.
+
+    Parameters:
+        connects: Commands of the stubbed connections made.
+    """
+
+    async def run() -> None:
+        pool = MCPSessionPool()
+        config = McpServerConfig(command="server")
+        entry = await pool.acquire(config)
+        entry.shutdown.set()
+        await entry.task
+        assert await pool.acquire(config) is not entry
+        await pool.close_all()
+
+    asyncio.run(run())
+    assert connects == ["server", "server"]
+
+
+def test_session_pool_close_all(connects: list[str]) -> None:
+    """Shut down every pooled session.
+
+    Parameters:
+        connects: Commands of the stubbed connections made.
+    """
+
+    async def run() -> None:
+        pool = MCPSessionPool()
+        entries = [
+            await pool.acquire(McpServerConfig(command=command))
+            for command in ("a", "b")
+        ]
+        await pool.close_all()
+        assert all(entry.task.done() for entry in entries)
+        await pool.acquire(McpServerConfig(command="a"))
+        await pool.close_all()
+
+    asyncio.run(run())
+    assert connects == ["a", "b", "a"]